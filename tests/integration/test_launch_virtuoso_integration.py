@@ -18,6 +18,7 @@ import argparse
 import configparser
 import os
 import shutil
+import socket
 import subprocess
 import uuid
 from pathlib import Path
@@ -25,12 +26,14 @@ from pathlib import Path
 import pytest
 
 from virtuoso_utilities.launch_virtuoso import (
-    BYTES_PER_BUFFER, DEFAULT_IMAGE, MIN_DB_SIZE_BYTES_FOR_CHECKPOINT_REMAP,
+    BYTES_PER_BUFFER, DEFAULT_CONTAINER_DATA_DIR, DEFAULT_DIRS_ALLOWED,
+    DEFAULT_IMAGE, MIN_DB_SIZE_BYTES_FOR_CHECKPOINT_REMAP,
     VIRTUOSO_MEMORY_PERCENTAGE, build_docker_run_command,
     bytes_to_docker_mem_str, calculate_max_checkpoint_remap,
-    check_container_exists, check_docker_installed, get_directory_size,
-    get_docker_image, get_optimal_buffer_values, grant_write_permissions,
-    parse_memory_value, remove_container, update_ini_memory_settings)
+    check_container_exists, check_docker_installed, get_container_status,
+    get_directory_size, get_docker_image, get_optimal_buffer_values,
+    grant_write_permissions, is_port_open, parse_memory_value,
+    remove_container, update_ini_memory_settings)
 
 TEST_CONTAINER_PREFIX = "virtuoso-launch-test"
 # Port range: ISQL 11120-11139, HTTP 8900-8919
@@ -150,6 +153,68 @@ class TestParseMemoryValue:
         assert "Warning" in captured.err
 
 
+class TestIsPortOpen:
+    """Tests for is_port_open function."""
+
+    def test_listening_port(self):
+        """Detect a port with a listening socket."""
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            assert is_port_open("127.0.0.1", server.getsockname()[1]) is True
+
+    def test_closed_port(self):
+        """Report a port without a listener as closed."""
+        with socket.socket() as server:
+            server.bind(("127.0.0.1", 0))
+            port = server.getsockname()[1]
+        assert is_port_open("127.0.0.1", port) is False
+
+
+class TestWaitForVirtuosoReady:
+    """Tests for the port probe in wait_for_virtuoso_ready."""
+
+    def test_closed_port_skips_isql(self, monkeypatch):
+        """Do not run isql while the local ISQL port is closed."""
+        import virtuoso_utilities.launch_virtuoso as launch_module
+
+        isql_calls = []
+        monkeypatch.setattr(launch_module, "is_port_open", lambda host, port: False)
+        monkeypatch.setattr(
+            launch_module,
+            "run_isql_command",
+            lambda *args, **kwargs: isql_calls.append(args) or (False, "", "Connection refused"),
+        )
+        ready = launch_module.wait_for_virtuoso_ready(dba_password="dba", timeout=1)
+        assert ready is False
+        assert isql_calls == []
+
+    def test_docker_mode_skips_port_probe(self, monkeypatch):
+        """Check a container through isql only, since docker-proxy fools the probe."""
+        import virtuoso_utilities.launch_virtuoso as launch_module
+
+        probe_calls = []
+        isql_calls = []
+        monkeypatch.setattr(
+            launch_module,
+            "is_port_open",
+            lambda host, port: probe_calls.append((host, port)) or False,
+        )
+        monkeypatch.setattr(
+            launch_module,
+            "run_isql_command",
+            lambda *args, **kwargs: isql_calls.append(args) or (True, "", ""),
+        )
+        ready = launch_module.wait_for_virtuoso_ready(
+            dba_password="dba",
+            docker_container="unused",
+            timeout=5,
+        )
+        assert ready is True
+        assert probe_calls == []
+        assert len(isql_calls) == 1
+
+
 class TestGetDirectorySize:
     """Tests for get_directory_size function."""
 
@@ -267,6 +332,33 @@ class TestUpdateIniMemorySettings:
         config.read(temp_ini_file)
         assert config.get("Parameters", "DirsAllowed") == "/data,/backup"
 
+    def test_replaces_file_atomically(self, temp_ini_file, temp_data_dir):
+        """Keep the file mode and leave no temporary file behind."""
+        os.chmod(temp_ini_file, 0o644)
+        update_ini_memory_settings(
+            str(temp_ini_file),
+            str(temp_data_dir),
+            number_of_buffers=20000,
+        )
+        assert os.stat(temp_ini_file).st_mode & 0o777 == 0o644
+        assert sorted(p.name for p in temp_data_dir.iterdir()) == ["virtuoso.ini"]
+
+    def test_failed_write_removes_temporary_file(self, temp_ini_file, temp_data_dir, monkeypatch):
+        """Leave the original file and no temporary file when writing fails."""
+        original = temp_ini_file.read_text()
+
+        def failing_write(self, fp, space_around_delimiters=True):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(configparser.ConfigParser, "write", failing_write)
+        update_ini_memory_settings(
+            str(temp_ini_file),
+            str(temp_data_dir),
+            number_of_buffers=20000,
+        )
+        assert temp_ini_file.read_text() == original
+        assert sorted(p.name for p in temp_data_dir.iterdir()) == ["virtuoso.ini"]
+
     def test_sets_client_timeouts(self, temp_ini_file, temp_data_dir):
         """Set SQL_QUERY_TIMEOUT and SQL_TXN_TIMEOUT to 0."""
         update_ini_memory_settings(
@@ -454,6 +546,16 @@ class TestBuildDockerRunCommand:
         assert volume_found, "Extra volume not found in command"
         assert "/container/path" in paths
 
+    def test_dirs_allowed_order(self, temp_data_dir):
+        """Keep DirsAllowed in a stable, duplicate-free order."""
+        args = self._create_args(
+            data_dir=str(temp_data_dir),
+            extra_volumes=["/a:/mnt/b", "/c:/mnt/a", "/d:/mnt/b"],
+        )
+        cmd, paths = build_docker_run_command(args)
+        assert paths == [*sorted(DEFAULT_DIRS_ALLOWED), DEFAULT_CONTAINER_DATA_DIR, "/mnt/b", "/mnt/a"]
+        assert f"VIRT_Parameters_DirsAllowed={','.join(paths)}" in cmd
+
     def test_estimated_db_size(self, temp_data_dir):
         """Set MaxCheckpointRemap env vars for large estimated DB."""
         args = self._create_args(
@@ -679,6 +781,26 @@ class TestThreadingParameters:
 # =============================================================================
 
 
+class TestDockerPreflight:
+    """Tests for the Docker checks done before launching."""
+
+    def test_launch_reports_missing_docker(self, monkeypatch):
+        """Fail with a clear error before querying Docker when it is missing."""
+        import virtuoso_utilities.launch_virtuoso as launch_module
+
+        queried = []
+        monkeypatch.setattr(launch_module, "check_docker_installed", lambda: False)
+        monkeypatch.setattr(launch_module, "get_container_status", queried.append)
+        with pytest.raises(RuntimeError, match="Docker command not found"):
+            launch_module.launch_virtuoso(name="unused")
+        assert queried == []
+
+    def test_check_docker_installed_missing(self, monkeypatch, tmp_path):
+        """Return False when docker is not on the PATH."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert check_docker_installed() is False
+
+
 class TestDockerInteraction:
     """Tests that interact with Docker daemon."""
 
@@ -704,6 +826,29 @@ class TestDockerInteraction:
         result = check_container_exists(unique_container_name)
         assert result is True
 
+    def test_get_container_status_nonexistent(self):
+        """Return None for non-existent container."""
+        assert get_container_status("nonexistent-container-12345") is None
+
+    def test_get_container_status_created(self, unique_container_name):
+        """Return the state of an existing container."""
+        subprocess.run(
+            ["docker", "create", "--name", unique_container_name, "alpine"],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        assert get_container_status(unique_container_name) == "created"
+
+    def test_get_container_status_ignores_id_prefix(self, unique_container_name):
+        """Do not match a container whose ID starts with the given name."""
+        container_id = subprocess.run(
+            ["docker", "create", "--name", unique_container_name, "alpine"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        assert get_container_status(container_id[:12]) is None
+
     def test_remove_container_success(self, unique_container_name):
         """Successfully remove container."""
         # Create a container
@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: 2025 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+"""
+Tests for bulk_load.py
+
+Tests cover:
+- Local N-Quads file discovery
+- Load progress reporting
+- SQL string literal escaping
+- Default loader count
+- Parsing of COUNT(*) results
+"""
+
+import logging
+import os
+import subprocess
+import threading
+
+import pytest
+
+from virtuoso_utilities.bulk_load import (
+    DEFAULT_PARALLEL_LOADERS,
+    _container_cpu_count,
+    _default_parallel_loaders,
+    _loaders_for_cpus,
+    _log_load_progress,
+    _parse_container_cpu_count,
+    _parse_count,
+    _sql_quote,
+    find_nquads_files_local,
+    iter_nquads_files_local,
+)
+
+
+class TestFindNquadsFilesLocal:
+    """Tests for find_nquads_files_local function."""
+
+    def _make_tree(self, root):
+        (root / "sub" / "deeper").mkdir(parents=True)
+        for path in ["a.nq.gz", "b.nq", "sub/c.nq.gz", "sub/deeper/d.nq.gz"]:
+            (root / path).write_bytes(b"")
+        (root / "dir.nq.gz").mkdir()
+
+    def test_non_recursive(self, tmp_path):
+        """Test that only top-level .nq.gz files are returned."""
+        self._make_tree(tmp_path)
+        assert find_nquads_files_local(str(tmp_path)) == [os.path.join(str(tmp_path), "a.nq.gz")]
+
+    def test_recursive(self, tmp_path):
+        """Test that .nq.gz files in subdirectories are returned."""
+        self._make_tree(tmp_path)
+        found = sorted(os.path.relpath(f, tmp_path) for f in find_nquads_files_local(str(tmp_path), recursive=True))
+        assert found == ["a.nq.gz", os.path.join("sub", "c.nq.gz"), os.path.join("sub", "deeper", "d.nq.gz")]
+
+    def test_empty_directory(self, tmp_path):
+        """Test that an empty directory yields no files."""
+        assert find_nquads_files_local(str(tmp_path), recursive=True) == []
+
+    def test_iter_is_lazy(self, tmp_path):
+        """Test that the iterator yields a match without scanning the whole tree."""
+        self._make_tree(tmp_path)
+        first = next(iter_nquads_files_local(str(tmp_path), recursive=True))
+        assert first.endswith(".nq.gz")
+
+
+class TestLogLoadProgress:
+    """Tests for _log_load_progress function."""
+
+    def test_logs_until_stopped(self, caplog):
+        """Test that progress is logged on every tick and stops with the event."""
+
+        class FakeSession:
+            def __init__(self, stop_event):
+                self.calls = 0
+                self.stop_event = stop_event
+
+            def fetchone(self, sql):
+                self.calls += 1
+                if self.calls == 2:
+                    self.stop_event.set()
+                return ("10", str(self.calls * 3))
+
+        stop_event = threading.Event()
+        session = FakeSession(stop_event)
+        with caplog.at_level(logging.INFO, logger="virtuoso_utilities.bulk_load"):
+            _log_load_progress(session, stop_event, interval=0)
+        assert session.calls == 2
+        assert "3/10 file(s) loaded" in caplog.text
+        assert "6/10 file(s) loaded" in caplog.text
+
+
+class TestSqlQuote:
+    """Tests for _sql_quote function."""
+
+    def test_escapes_quotes_and_backslashes(self):
+        """Test that quotes and backslashes are doubled."""
+        assert _sql_quote("/data/o'neil") == "/data/o''neil"
+        assert _sql_quote("C:\\data\\rdf") == "C:\\\\data\\\\rdf"
+
+    def test_plain_path_unchanged(self):
+        """Test that paths without special characters are unchanged."""
+        assert _sql_quote("/data/rdf") == "/data/rdf"
+
+
+class TestParseCount:
+    """Tests for _parse_count function."""
+
+    def test_reads_first_value(self):
+        """Test that the count is read from the first whitespace-separated value."""
+        assert _parse_count("42\n", "the file count") == 42
+
+    @pytest.mark.parametrize("stdout", ["", "\n", "Error: no count"])
+    def test_unexpected_output_raises(self, stdout):
+        """Test that output without a number raises a RuntimeError with the raw text."""
+        with pytest.raises(RuntimeError, match="Could not read the file count") as excinfo:
+            _parse_count(stdout, "the file count")
+        assert repr(stdout) in str(excinfo.value)
+
+
+class TestParallelLoaderDefaults:
+    """Tests for the default number of rdf_loader_run() sessions."""
+
+    def test_loaders_for_cpus(self):
+        """Test the cores / 2.5 rule and its lower bound."""
+        assert _loaders_for_cpus(1) == 1
+        assert _loaders_for_cpus(4) == 1
+        assert _loaders_for_cpus(10) == 4
+        assert _loaders_for_cpus(64) == 25
+
+    def test_container_cpu_count_without_docker(self):
+        """Test that a missing docker binary yields None instead of raising."""
+        assert _container_cpu_count("/nonexistent/docker", "virtuoso") is None
+
+    @pytest.mark.parametrize("output, expected", [
+        ("8\nmax 100000\n", 8),
+        ("8\n200000 100000\n", 2),
+        ("8\n150000 100000\n", 2),
+        ("8\n50000 100000\n", 1),
+        ("2\n800000 100000\n", 2),
+        ("8\n-1\n100000\n", 8),
+        ("8\n", 8),
+        ("", None),
+        ("nproc: not found\n", None),
+    ])
+    def test_parse_container_cpu_count(self, output, expected):
+        """Test that nproc is clamped to the cgroup v1/v2 CPU quota."""
+        assert _parse_container_cpu_count(output) == expected
+
+    def test_host_count_when_docker_exec_fails(self, monkeypatch):
+        """Test that the host CPU count is used when docker exec fails."""
+        def failing_run(cmd, **kwargs):
+            return subprocess.CompletedProcess(cmd, 1, "", "Error: No such container: virtuoso")
+
+        monkeypatch.setattr(subprocess, "run", failing_run)
+        assert _container_cpu_count("docker", "virtuoso") is None
+        assert _default_parallel_loaders("docker", "virtuoso") == DEFAULT_PARALLEL_LOADERS
+
+    def test_host_count_without_container(self):
+        """Test that native mode sizes the loaders on the host CPUs."""
+        assert _default_parallel_loaders("docker") == DEFAULT_PARALLEL_LOADERS
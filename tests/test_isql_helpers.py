@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2025 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+"""
+Tests for isql_helpers.py
+
+Tests cover:
+- IsqlSession statement/marker framing against a fake isql executable
+- Error detection inside a persistent session
+- Row fetching
+- Local script execution without a shell
+"""
+
+import argparse
+import os
+import stat
+import sys
+
+import pytest
+
+from virtuoso_utilities.isql_helpers import IsqlSession, run_isql_command
+
+FAKE_ISQL = """\
+import re
+import sys
+
+statement = ""
+for line in sys.stdin:
+    # Like isql, only run a statement once its terminating ';' is read
+    statement = f"{statement} {line.strip()}".strip()
+    if not statement.endswith(";"):
+        continue
+    line, statement = statement, ""
+    if line == "EXIT;":
+        break
+    marker = re.fullmatch(r"SELECT '(.*)';", line)
+    if line == "DIE;":
+        print("Error response from daemon: container is not running", flush=True)
+        sys.exit(1)
+    elif marker:
+        print("SQL> " + marker.group(1), flush=True)
+    elif "FAIL" in line:
+        print("*** Error 42000: [Virtuoso Driver][Virtuoso Server]SR001: failed", flush=True)
+        print("at line 1 of Top-Level:", flush=True)
+    elif line:
+        print("SQL> " + line.rstrip(";").upper(), flush=True)
+"""
+
+
+@pytest.fixture
+def isql_args(tmp_path):
+    script = tmp_path / "isql"
+    script.write_text(f"#!{sys.executable}\n{FAKE_ISQL}")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return argparse.Namespace(
+        docker_container=None,
+        isql_path=os.fspath(script),
+        host="localhost",
+        port=1111,
+        user="dba",
+        password="dba",
+    )
+
+
+class TestIsqlSession:
+    """Tests for the IsqlSession class."""
+
+    def test_execute_returns_statement_output(self, isql_args):
+        """Test that each call only returns the output of its own statements."""
+        with IsqlSession(isql_args) as session:
+            assert session.execute("select 1;") == (True, "SELECT 1", "")
+            assert session.execute("select 2;") == (True, "SELECT 2", "")
+
+    def test_execute_reports_errors(self, isql_args):
+        """Test that isql error lines are returned as stderr and mark failure."""
+        with IsqlSession(isql_args) as session:
+            success, stdout, stderr = session.execute("FAIL;")
+            assert not success
+            assert stdout == ""
+            assert stderr.startswith("*** Error 42000")
+            assert "at line 1" in stderr
+            # The session stays usable after a failed statement
+            assert session.execute("ok;") == (True, "OK", "")
+
+    def test_execute_terminates_statement(self, isql_args):
+        """Test that a statement without ';' does not swallow the marker."""
+        with IsqlSession(isql_args) as session:
+            assert session.execute("select 3") == (True, "SELECT 3", "")
+
+    def test_execute_reports_output_of_terminated_session(self, isql_args):
+        """Test that the output of a dying process is returned as stderr."""
+        with IsqlSession(isql_args) as session:
+            success, _, stderr = session.execute("DIE;")
+            assert not success
+            assert "terminated unexpectedly" in stderr
+            assert "container is not running" in stderr
+
+    def test_fetchone_splits_columns(self, isql_args):
+        """Test that fetchone returns the first row as a tuple of columns."""
+        with IsqlSession(isql_args) as session:
+            assert session.fetchone("3 2 1;") == ("3", "2", "1")
+            assert session.fetchone("FAIL;") is None
+
+    def test_fetchcolumn_keeps_whole_values(self, isql_args):
+        """Test that fetchcolumn does not split values containing spaces."""
+        with IsqlSession(isql_args) as session:
+            assert session.fetchcolumn("/data/my file.nq.gz;") == ["/DATA/MY FILE.NQ.GZ"]
+            assert session.fetchcolumn("FAIL;") is None
+
+    def test_execute_requires_open_session(self, isql_args):
+        """Test that executing on a closed session raises."""
+        with pytest.raises(RuntimeError):
+            IsqlSession(isql_args).execute("select 1;")
+
+
+class TestRunIsqlCommand:
+    """Tests for run_isql_command function."""
+
+    def test_local_script_is_fed_to_stdin(self, isql_args, tmp_path):
+        """Test that a local script runs without shell redirection."""
+        script = tmp_path / "it's a script.sql"
+        script.write_text("select 1;\n")
+        success, stdout, stderr = run_isql_command(isql_args, script_path=str(script))
+        assert success
+        assert stdout == "SQL> SELECT 1"
+        assert stderr == ""
@@ -8,12 +8,13 @@
 # -*- coding: utf-8 -*-
 
 """
-Performs sequential bulk loading of RDF N-Quads Gzipped files (`.nq.gz`)
+Performs bulk loading of RDF N-Quads Gzipped files (`.nq.gz`)
 into OpenLink Virtuoso using the official `ld_dir`/`ld_dir_all` and
 `rdf_loader_run` method.
 
 Registers files matching *.nq.gz using ld_dir/ld_dir_all into DB.DBA.load_list,
-then runs a single `rdf_loader_run()` process to load the registered files.
+then runs several concurrent `rdf_loader_run()` sessions that cooperatively
+drain the registered files.
 
 IMPORTANT:
 - Only files with the extension `.nq.gz` will be processed.
@@ -21,34 +22,173 @@ IMPORTANT:
   accessible by the Virtuoso server process itself.
 - This directory path MUST be listed in the 'DirsAllowed' parameter
   within the Virtuoso INI file (e.g., virtuoso.ini).
-- When using Docker, data-directory is the path INSIDE the container.
-  Files will be accessed and loaded from within the container.
+- When using Docker, data-directory is the path INSIDE the container,
+  unless --container-data-directory gives that path; data-directory is then
+  the bind-mounted path on the host, where the files are checked.
 
 Reference:
 - https://vos.openlinksw.com/owiki/wiki/VOS/VirtBulkRDFLoader
 """
 
 import argparse
-import glob
 import logging
+import math
 import os
+import shutil
+import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from virtuoso_utilities.isql_helpers import run_isql_command
+from virtuoso_utilities.isql_helpers import IsqlSession, run_isql_command
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_VIRTUOSO_HOST = "localhost"
 DEFAULT_VIRTUOSO_PORT = 1111
 DEFAULT_VIRTUOSO_USER = "dba"
+DEFAULT_LOG_LEVEL = "ERROR"
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
 ISQL_PATH_HOST = "isql"
 ISQL_PATH_DOCKER = "isql"
 DOCKER_PATH = "docker"
 CHECKPOINT_INTERVAL = 60
 SCHEDULER_INTERVAL = 10
+# Maximum number of failed files listed in the error message
+FAILED_FILES_REPORT_LIMIT = 100
+# Seconds between two progress reports while the loaders are running
+PROGRESS_INTERVAL = 30
+# log_enable mode used by the loader sessions: no transaction log, autocommit.
+# This is already rdf_loader_run()'s default; it is passed explicitly only to
+# document the mode the loaders rely on. The final checkpoint makes the data
+# durable and log_enable(3, 1) in the cleanup restores the default.
+LOADER_LOG_ENABLE = 2
+LOADER_SQL = f"rdf_loader_run(log_enable=>{LOADER_LOG_ENABLE});"
+
+
+def _available_cpu_count():
+    """
+    Number of CPUs this process may run on. Unlike os.cpu_count(), this
+    honours CPU affinity and cpusets (e.g. 'docker run --cpuset-cpus').
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# Prints nproc, then the CFS quota and period: cgroup v2 'cpu.max' holds both
+# ("max" when unlimited), cgroup v1 has one file each (-1 when unlimited)
+_CONTAINER_CPU_SCRIPT = (
+    "nproc; cat /sys/fs/cgroup/cpu.max 2>/dev/null"
+    " || cat /sys/fs/cgroup/cpu/cpu.cfs_quota_us /sys/fs/cgroup/cpu/cpu.cfs_period_us 2>/dev/null"
+)
+
+
+def _parse_container_cpu_count(output):
+    """
+    Number of CPUs from the output of _CONTAINER_CPU_SCRIPT: nproc, clamped
+    to the CFS quota set by e.g. 'docker run --cpus'. Returns None if nproc
+    cannot be read; a missing or unlimited quota leaves nproc as is.
+    """
+    values = output.split()
+    if not values or not values[0].isdigit():
+        return None
+    cpus = int(values[0])
+    try:
+        quota, period = int(values[1]), int(values[2])
+    except (IndexError, ValueError):
+        # No CPU controller mounted, or 'max' on cgroup v2
+        return cpus
+    if quota > 0 and period > 0:
+        # A fractional quota still lets one loader run
+        cpus = min(cpus, max(1, math.ceil(quota / period)))
+    return cpus
+
+
+def _container_cpu_count(docker_path, docker_container):
+    """
+    Number of CPUs available inside a Docker container, as reported by
+    'nproc' and limited by the container's CPU quota. Returns None if it
+    cannot be determined.
+    """
+    try:
+        result = subprocess.run(
+            [docker_path, 'exec', docker_container, 'sh', '-c', _CONTAINER_CPU_SCRIPT],
+            capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return _parse_container_cpu_count(result.stdout)
+
+
+def _loaders_for_cpus(cpu_count):
+    """Number of concurrent rdf_loader_run() sessions recommended by OpenLink: cores / 2.5"""
+    return max(1, int(cpu_count / 2.5))
+
+
+DEFAULT_PARALLEL_LOADERS = _loaders_for_cpus(_available_cpu_count())
+
+
+def _default_parallel_loaders(docker_path, docker_container=None):
+    """
+    Number of loader sessions when none is given. The loaders run inside the
+    server, so in Docker mode they are sized on the container's CPUs, which
+    may be far fewer than the host's; the host count is used if those cannot
+    be read.
+    """
+    container_cpus = _container_cpu_count(docker_path, docker_container) if docker_container else None
+    return _loaders_for_cpus(container_cpus) if container_cpus else DEFAULT_PARALLEL_LOADERS
 
 NQ_GZ_PATTERN = '*.nq.gz'
+NQ_GZ_SUFFIX = NQ_GZ_PATTERN.lstrip('*')
+
+# Virtuoso string literals also interpret backslash escapes, so a literal
+# backslash (e.g. in a Windows path) must be doubled as well
+_SQL_QUOTE_TABLE = str.maketrans({"'": "''", "\\": "\\\\"})
+
+
+def _sql_quote(value):
+    """Escape single quotes and backslashes for use inside a SQL string literal."""
+    return value.translate(_SQL_QUOTE_TABLE)
+
+
+_NQ_GZ_PATTERN_SQL = _sql_quote(NQ_GZ_PATTERN)
+
+
+def _parse_count(stdout, what):
+    """
+    Read the value of a SELECT COUNT(*) from the isql output, raising a
+    RuntimeError that shows the raw output when it is not a number.
+    """
+    value = stdout.split()[0] if stdout.strip() else ""
+    if not value.isdigit():
+        raise RuntimeError(f"Could not read {what} from the isql output: {stdout!r}")
+    return int(value)
+
+
+def iter_nquads_files_local(directory, recursive=False):
+    """
+    Lazily yield the N-Quads Gzipped files (`*.nq.gz`) in a directory on
+    local filesystem, so callers can stop the scan as soon as they have
+    seen enough.
+    """
+    # A single scandir pass per directory: the DirEntry type cache avoids a
+    # stat() per entry and the suffix check replaces glob's second listing.
+    # Subdirectories are visited only after the current directory is done,
+    # so an early-exiting caller never descends when a match is at the top,
+    # and only one directory handle is open at a time.
+    subdirectories = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(NQ_GZ_SUFFIX) and entry.is_file():
+                yield entry.path
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+    for subdirectory in subdirectories:
+        yield from iter_nquads_files_local(subdirectory, recursive)
 
 
 def find_nquads_files_local(directory, recursive=False):
@@ -56,31 +196,41 @@ def find_nquads_files_local(directory, recursive=False):
     Find all N-Quads Gzipped files (`*.nq.gz`) in a directory on local filesystem.
     Returns a list of file paths.
     """
-    pattern = NQ_GZ_PATTERN
-    if recursive:
-        matches = []
-        for root, _, _ in os.walk(directory):
-            path_pattern = os.path.join(root, pattern)
-            matches.extend(glob.glob(path_pattern))
-        return matches
-    else:
-        path_pattern = os.path.join(directory, pattern)
-        return glob.glob(path_pattern)
+    return list(iter_nquads_files_local(directory, recursive))
+
+
+def _log_load_progress(session, stop_event, interval=PROGRESS_INTERVAL):
+    """
+    Periodically log how many registered files have been loaded, until
+    stop_event is set. Meant to run in a background thread while the
+    rdf_loader_run() sessions are busy; the given session must not be used
+    by anyone else in the meantime.
+    """
+    progress_sql = (
+        "SELECT COUNT(*), COALESCE(SUM(CASE WHEN ll_state = 2 THEN 1 ELSE 0 END), 0) "
+        "FROM DB.DBA.load_list;"
+    )
+    while not stop_event.wait(interval):
+        progress = session.fetchone(progress_sql)
+        if progress:
+            total_files, loaded_files = progress[:2]
+            logger.info(f"Bulk load progress: {loaded_files}/{total_files} file(s) loaded.")
 
 
 def bulk_load(
     data_directory: str,
     password: str,
-    host: str = "localhost",
-    port: int = 1111,
-    user: str = "dba",
+    host: str = DEFAULT_VIRTUOSO_HOST,
+    port: int = DEFAULT_VIRTUOSO_PORT,
+    user: str = DEFAULT_VIRTUOSO_USER,
     recursive: bool = False,
     docker_container: str = None,
     isql_path: str = ISQL_PATH_HOST,
     docker_isql_path: str = ISQL_PATH_DOCKER,
     docker_path: str = DOCKER_PATH,
     container_data_directory: str = None,
-    log_level: str = "ERROR"
+    log_level: str = DEFAULT_LOG_LEVEL,
+    parallel_loaders: int = None,
 ) -> None:
     """
     Perform Virtuoso bulk loading of N-Quads files.
@@ -88,7 +238,8 @@ def bulk_load(
     This function can be imported and called programmatically, avoiding subprocess overhead.
 
     Args:
-        data_directory: Path to directory containing .nq.gz files (host path for file operations)
+        data_directory: Path to directory containing .nq.gz files (in Docker mode the path inside
+                        the container, unless container_data_directory is given)
         password: Virtuoso DBA password
         host: Virtuoso server host
         port: Virtuoso server port
@@ -100,10 +251,15 @@ def bulk_load(
         docker_path: Path to docker binary
         container_data_directory: Path INSIDE container where Virtuoso accesses files (if different from data_directory)
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL). Default: ERROR
+        parallel_loaders: Number of concurrent rdf_loader_run() sessions. Default: CPU cores / 2.5,
+                          counting the CPUs of the container in Docker mode
 
     Raises:
+        ValueError: If parallel_loaders is lower than 1
         RuntimeError: If bulk load fails
     """
+    if parallel_loaders is not None and parallel_loaders < 1:
+        raise ValueError("parallel_loaders must be at least 1")
 
     logging.basicConfig(level=getattr(logging, log_level.upper()), format='%(levelname)s: %(message)s', force=True)
 
@@ -123,71 +279,130 @@ def bulk_load(
     data_dir = args.data_directory
     container_dir = args.container_data_directory if args.container_data_directory else data_dir
 
-    files = find_nquads_files_local(data_dir, args.recursive)
-
-    if not files:
+    # ld_dir/ld_dir_all enumerate the files server-side; locally we only need
+    # to know that at least one exists, so stop the scan at the first match.
+    # In Docker mode the directory may only exist inside the container, in
+    # which case the check is left to the count of registered files.
+    if os.path.isdir(data_dir):
+        has_files = next(iter_nquads_files_local(data_dir, args.recursive), None) is not None
+    else:
+        has_files = bool(args.docker_container)
+    if not has_files:
         logger.warning(f"No files matching '{NQ_GZ_PATTERN}' found in '{data_dir}'.")
         return
 
-    # Clean up any leftover entries from previous bulk loads
-    cleanup_sql = "DELETE FROM DB.DBA.load_list;"
-    run_isql_command(args, sql_command=cleanup_sql)
+    # Resolve the client binary once: every isql/docker exec call below then
+    # runs an absolute path, and a missing binary fails before any work starts
+    if docker_container:
+        args.docker_path = shutil.which(docker_path)
+        if args.docker_path is None:
+            raise RuntimeError(f"Docker executable '{docker_path}' not found. Make sure it is installed and in your PATH.")
+    else:
+        args.isql_path = shutil.which(isql_path)
+        if args.isql_path is None:
+            raise RuntimeError(f"isql executable '{isql_path}' not found. Make sure the Virtuoso client tools are installed and in your PATH.")
+
+    if parallel_loaders is None:
+        parallel_loaders = _default_parallel_loaders(args.docker_path, docker_container)
 
     ld_function = "ld_dir_all" if args.recursive else "ld_dir"
 
-    container_dir_sql_escaped = container_dir.replace("'", "''")
-    file_pattern_sql_escaped = NQ_GZ_PATTERN.replace("'", "''")
+    container_dir_sql_escaped = _sql_quote(container_dir)
 
+    # Clean up any leftover entries from previous bulk loads and register the
+    # new files in the same statement batch. The DELETE is committed explicitly
+    # so that the loader sessions never wait on its locks.
     # Use empty string to let Virtuoso read graph URIs from nquads (4th field)
-    register_sql = f"{ld_function}('{container_dir_sql_escaped}', '{file_pattern_sql_escaped}', '');"
-    success_reg, _, stderr_reg = run_isql_command(args, sql_command=register_sql)
-
-    if not success_reg or "Unable to list files" in stderr_reg or "FA020" in stderr_reg:
-        raise RuntimeError(f"Failed to register files using {ld_function}.\nError: {stderr_reg}")
-
-    loader_sql = "rdf_loader_run();"
-    success_load, _, stderr_load = run_isql_command(args, sql_command=loader_sql)
-
-    if not success_load:
-        raise RuntimeError(f"rdf_loader_run() failed.\nError: {stderr_load}")
-
-    stats_sql = "SELECT COUNT(*) AS total_files, SUM(CASE WHEN ll_state = 2 THEN 1 ELSE 0 END) AS loaded, SUM(CASE WHEN ll_state <> 2 OR ll_error IS NOT NULL THEN 1 ELSE 0 END) AS issues FROM DB.DBA.load_list;"
-    success_stats, stdout_stats, _ = run_isql_command(args, sql_command=stats_sql)
-
-    if success_stats:
-        lines = stdout_stats.strip().splitlines()
-        for i, line in enumerate(lines):
-            if i > 3 and not line.endswith("Rows.") and "INTEGER" not in line and "VARCHAR" not in line:
-                parts = line.split()
-                if len(parts) >= 3 and parts[0].isdigit():
-                    total_files = int(parts[0])
-                    loaded_files = int(parts[1]) if parts[1] != "NULL" else 0
-                    issues = int(parts[2]) if parts[2] != "NULL" else 0
-
-                    if total_files != loaded_files or issues != 0:
-                        failed_sql = "SELECT ll_file FROM DB.DBA.load_list WHERE ll_state <> 2 OR ll_error IS NOT NULL;"
-                        success_failed, stdout_failed, _ = run_isql_command(args, sql_command=failed_sql)
-                        failed_files = []
-                        if success_failed:
-                            for line in stdout_failed.strip().splitlines():
-                                line = line.strip()
-                                if line and not line.startswith("ll_file") and not line.endswith("Rows.") and line != "VARCHAR":
-                                    failed_files.append(line)
-                        raise RuntimeError(
-                            f"Bulk load failed: {issues} file(s) had issues.\n"
-                            f"Failed files:\n" + "\n".join(f"  - {f}" for f in failed_files)
-                        )
-                    break
-
-    delete_loaded_sql = "DELETE FROM DB.DBA.load_list WHERE ll_state = 2;"
-    success_delete, _, stderr_delete = run_isql_command(args, sql_command=delete_loaded_sql)
-    if not success_delete:
-        raise RuntimeError(f"Failed to clean up load_list table.\nError: {stderr_delete}")
-
-    cleanup_sql = f"log_enable(3, 1); checkpoint; checkpoint_interval({CHECKPOINT_INTERVAL}); scheduler_interval({SCHEDULER_INTERVAL});"
-    success_final, _, stderr_final = run_isql_command(args, sql_command=cleanup_sql)
-    if not success_final:
-        raise RuntimeError(f"Failed to run final checkpoint.\nError details: {stderr_final}")
+    register_sql = (
+        "DELETE FROM DB.DBA.load_list; COMMIT WORK; "
+        f"{ld_function}('{container_dir_sql_escaped}', '{_NQ_GZ_PATTERN_SQL}', '');"
+    )
+
+    # Short statements share one persistent isql connection; only the
+    # long-running loaders get their own.
+    with IsqlSession(args) as session:
+        success_reg, _, stderr_reg = session.execute(register_sql)
+
+        if not success_reg or "Unable to list files" in stderr_reg or "FA020" in stderr_reg:
+            raise RuntimeError(f"Failed to register files using {ld_function}.\nError: {stderr_reg}")
+
+        # The local scan stops at the first match, so the file count comes
+        # from what Virtuoso actually registered
+        success_count, registered, stderr_count = session.execute("SELECT COUNT(*) FROM DB.DBA.load_list;")
+        if not success_count:
+            raise RuntimeError(f"Failed to count the files registered using {ld_function}.\nError: {stderr_count}")
+        registered_files = _parse_count(registered, "the registered file count")
+        logger.info(f"Registered {registered_files} file(s) from '{container_dir}' using {ld_function}.")
+        if registered_files == 0:
+            logger.warning(f"No files matching '{NQ_GZ_PATTERN}' found in '{container_dir}'.")
+            return
+        # Each session loads one file at a time, extra ones would sit idle
+        parallel_loaders = min(parallel_loaders, registered_files)
+
+        # Each loader runs in its own isql session; Virtuoso hands out the
+        # DB.DBA.load_list rows to the sessions, so they never load the same file.
+        logger.info(f"Starting {parallel_loaders} rdf_loader_run() session(s)...")
+
+        # The bookkeeping session is idle while the loaders run, so it can be
+        # lent to the progress monitor; skipped when nobody would see the output.
+        stop_progress = threading.Event()
+        progress_thread = None
+        if logger.isEnabledFor(logging.INFO):
+            progress_thread = threading.Thread(
+                target=_log_load_progress, args=(session, stop_progress), daemon=True
+            )
+            progress_thread.start()
+
+        # Loader results are handled as each session finishes, so a failing
+        # loader is reported right away instead of after the slowest one
+        loader_errors = []
+        try:
+            with ThreadPoolExecutor(max_workers=parallel_loaders) as executor:
+                futures = [
+                    executor.submit(run_isql_command, args, sql_command=LOADER_SQL)
+                    for _ in range(parallel_loaders)
+                ]
+                for finished, future in enumerate(as_completed(futures), start=1):
+                    success, _, stderr = future.result()
+                    if success:
+                        logger.info(f"rdf_loader_run() session finished ({finished}/{parallel_loaders}).")
+                    else:
+                        logger.error(f"rdf_loader_run() session failed ({finished}/{parallel_loaders}): {stderr}")
+                        loader_errors.append(stderr)
+        finally:
+            stop_progress.set()
+            if progress_thread is not None:
+                progress_thread.join()
+
+        if loader_errors:
+            raise RuntimeError(f"rdf_loader_run() failed in {len(loader_errors)} of {parallel_loaders} session(s).\nError: {loader_errors[0]}")
+
+        # A file is loaded only if ll_state = 2 and ll_error is NULL. Only the
+        # count is fetched on success; the paths are listed (up to a limit)
+        # just when something failed.
+        failed_filter = "FROM DB.DBA.load_list WHERE ll_state <> 2 OR ll_error IS NOT NULL"
+        success_failed, failed_count, stderr_failed = session.execute(f"SELECT COUNT(*) {failed_filter};")
+        if not success_failed:
+            raise RuntimeError(f"Failed to check the load status of the registered files.\nError: {stderr_failed}")
+        issues = _parse_count(failed_count, "the failed file count")
+
+        if issues:
+            failed_files = session.fetchcolumn(f"SELECT TOP {FAILED_FILES_REPORT_LIMIT} ll_file {failed_filter};") or []
+            if issues > len(failed_files):
+                failed_files.append(f"... and {issues - len(failed_files)} more")
+            raise RuntimeError(
+                f"Bulk load failed: {issues} file(s) had issues.\n"
+                f"Failed files:\n" + "\n".join(f"  - {f}" for f in failed_files)
+            )
+
+        # Remove the loaded entries and run the final checkpoint
+        cleanup_sql = (
+            "DELETE FROM DB.DBA.load_list WHERE ll_state = 2; "
+            f"log_enable(3, 1); checkpoint; checkpoint_interval({CHECKPOINT_INTERVAL}); scheduler_interval({SCHEDULER_INTERVAL});"
+        )
+        success_final, _, stderr_final = session.execute(cleanup_sql)
+        if not success_final:
+            raise RuntimeError(f"Failed to clean up load_list table and run final checkpoint.\nError details: {stderr_final}")
 
 
 def main():  # pragma: no cover
@@ -195,7 +410,7 @@ def main():  # pragma: no cover
     CLI entry point that parses arguments and calls bulk_load().
     """
     parser = argparse.ArgumentParser(
-        description=f"Sequential N-Quads Gzipped (`{NQ_GZ_PATTERN}`) bulk loader for OpenLink Virtuoso using ld_dir/rdf_loader_run.",
+        description=f"Parallel N-Quads Gzipped (`{NQ_GZ_PATTERN}`) bulk loader for OpenLink Virtuoso using ld_dir/rdf_loader_run.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""\
 Example usage:
@@ -206,17 +421,26 @@ Example usage:
   python bulk_load.py -d /database/data -k mypassword --recursive \
     --docker-container virtuoso_container
 
+  # Docker mode with /data/rdf on the host bind-mounted to /database/data
+  python bulk_load.py -d /data/rdf -k mypassword \
+    --docker-container virtuoso_container --container-data-directory /database/data
+
+  # Load using 4 concurrent rdf_loader_run() sessions
+  python bulk_load.py -d /data/rdf -k mypassword --parallel-loaders 4
+
 IMPORTANT:
 - Only files with the extension `.nq.gz` will be loaded.
 - The data directory (-d) must be accessible by the Virtuoso process
   and listed in the 'DirsAllowed' setting in virtuoso.ini.
-- When using Docker mode, data-directory is the path INSIDE the container.
-  Files are accessed and loaded directly inside the container.
+- When using Docker mode, data-directory is the path INSIDE the container,
+  unless --container-data-directory is given: then data-directory is the
+  bind-mounted host path and --container-data-directory the path inside.
 """
     )
 
     parser.add_argument("-d", "--data-directory", required=True,
-                        help="Path to the N-Quads Gzipped (`.nq.gz`) files. When using Docker, this must be the path INSIDE the container.")
+                        help="Path to the N-Quads Gzipped (`.nq.gz`) files. When using Docker, this must be the path INSIDE the container, "
+                             "unless --container-data-directory is given, in which case it is the bind-mounted host path.")
     parser.add_argument("-H", "--host", default=DEFAULT_VIRTUOSO_HOST,
                         help=f"Virtuoso server host (Default: {DEFAULT_VIRTUOSO_HOST}).")
     parser.add_argument("-P", "--port", type=int, default=DEFAULT_VIRTUOSO_PORT,
@@ -227,15 +451,24 @@ IMPORTANT:
                         help="Virtuoso password.")
     parser.add_argument("--recursive", action='store_true',
                         help="Load files recursively from subdirectories (uses ld_dir_all).")
-    parser.add_argument("--log-level", default="ERROR", choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-                        help="Logging level (Default: ERROR).")
+    parser.add_argument("--parallel-loaders", type=int,
+                        help=f"Number of concurrent rdf_loader_run() sessions (Default: CPU cores / 2.5 = {DEFAULT_PARALLEL_LOADERS}, "
+                             "or the container's CPU cores / 2.5 in Docker mode, within its --cpus limit).")
+    parser.add_argument("--log-level", default=DEFAULT_LOG_LEVEL, choices=LOG_LEVELS,
+                        help=f"Logging level (Default: {DEFAULT_LOG_LEVEL}).")
 
     docker_group = parser.add_argument_group('Docker Options')
     docker_group.add_argument("--docker-container",
                         help="Name or ID of the running Virtuoso Docker container. If provided, 'isql' will be run via 'docker exec'.")
+    docker_group.add_argument("--container-data-directory",
+                        help="Path of the data directory INSIDE the container, when -d is the bind-mounted host path. "
+                             "The files are then checked on the host instead of through the container.")
 
     args = parser.parse_args()
 
+    if args.parallel_loaders is not None and args.parallel_loaders < 1:
+        parser.error("--parallel-loaders must be at least 1")
+
     try:
         bulk_load(
             data_directory=args.data_directory,
@@ -245,7 +478,9 @@ IMPORTANT:
             user=args.user,
             recursive=args.recursive,
             docker_container=args.docker_container,
-            log_level=args.log_level
+            container_data_directory=args.container_data_directory,
+            log_level=args.log_level,
+            parallel_loaders=args.parallel_loaders,
         )
         sys.exit(0)
     except RuntimeError as e:
@@ -8,27 +8,45 @@ handling both direct execution and execution via Docker.
 """
 import argparse
 import os
-import shlex
 import subprocess
 import sys
+import uuid
 from typing import Union
 
+# isql prefix for error messages; with stderr merged into stdout these lines
+# are the only way to tell a failed statement apart inside a session
+ISQL_ERROR_PREFIX = "*** Error"
+ISQL_PROMPT = "SQL>"
+
 
 def _run_subprocess(
-    command: Union[list[str], str],
-    use_shell: bool = False,
+    command: list[str],
+    input_path: Union[str, None] = None,
     encoding: str = 'utf-8'
 ) -> tuple[int, str, str]:
-    """Internal helper to run a subprocess command. Always captures output."""
+    """
+    Internal helper to run a subprocess command. Always captures output.
+    If input_path is given, the file is connected to the process stdin.
+    """
     try:
-        process = subprocess.run(
-            command,
-            shell=use_shell,
-            capture_output=True,
-            text=True,
-            check=False,
-            encoding=encoding
-        )
+        if input_path:
+            with open(input_path, 'r', encoding=encoding) as input_file:
+                process = subprocess.run(
+                    command,
+                    stdin=input_file,
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    encoding=encoding
+                )
+        else:
+            process = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                check=False,
+                encoding=encoding
+            )
         stdout = process.stdout.strip() if process.stdout else ""
         stderr = process.stderr.strip() if process.stderr else ""
         return process.returncode, stdout, stderr
@@ -73,8 +91,8 @@ def run_isql_command(
     if not ((sql_command is None) ^ (script_path is None)):
         raise ValueError("Exactly one of sql_command or script_path must be provided.")
 
-    command_to_run: Union[list[str], str] = []
-    use_shell = False
+    command_to_run: list[str] = []
+    input_path = None
     effective_isql_path_for_error = ""
     command_description = ""
 
@@ -88,24 +106,6 @@ def run_isql_command(
 
         effective_isql_path_for_error = f"'{args.docker_isql_path}' inside container '{args.docker_container}' via '{args.docker_path}'"
 
-        exec_content = ""
-        if sql_command:
-            exec_content = sql_command
-            command_description = "ISQL command (Docker)"
-        else:
-            command_description = "ISQL script (Docker)"
-            if not os.path.exists(script_path):
-                 print(f"Error: Script file not found at '{script_path}'", file=sys.stderr)
-                 return False, "", f"Script file not found: {script_path}"
-            print("Reading script content for docker exec...", file=sys.stderr)
-            try:
-                with open(script_path, 'r', encoding='utf-8') as f:
-                    sql_content = f.read()
-                exec_content = sql_content.replace('\n', ' ').strip()
-            except Exception as e:
-                print(f"Error reading SQL script file '{script_path}': {e}", file=sys.stderr)
-                return False, "", str(e)
-
         docker_internal_host = "localhost"
         docker_internal_port = 1111
         command_to_run = [
@@ -116,8 +116,19 @@ def run_isql_command(
             f"{docker_internal_host}:{docker_internal_port}",
             args.user,
             args.password,
-            f"exec={exec_content}"
         ]
+        if sql_command:
+            command_description = "ISQL command (Docker)"
+            command_to_run.append(f"exec={sql_command}")
+        else:
+            command_description = "ISQL script (Docker)"
+            if not os.path.exists(script_path):
+                 print(f"Error: Script file not found at '{script_path}'", file=sys.stderr)
+                 return False, "", f"Script file not found: {script_path}"
+            # Stream the script into the container's isql over stdin, keeping
+            # its line structure and avoiding a copy into the container
+            command_to_run.insert(2, '-i')
+            input_path = script_path
 
     else:
         if not hasattr(args, 'isql_path') or not args.isql_path:
@@ -141,20 +152,18 @@ def run_isql_command(
                 print(f"Error: Script file not found at '{script_path}'", file=sys.stderr)
                 return False, "", f"Script file not found: {script_path}"
 
-            effective_isql_path_for_error += " using shell redirection"
-            use_shell = True
-
-            base_command_list = [
-                 args.isql_path,
-                 f"{args.host}:{args.port}",
-                 args.user,
-                 args.password,
-                 f"< {shlex.quote(script_path)}" # Use shlex.quote for safety
-             ]
-            command_to_run = " ".join(base_command_list)
+            # Feed the script to isql's stdin directly instead of going
+            # through a shell for the '<' redirection
+            input_path = script_path
+            command_to_run = [
+                args.isql_path,
+                f"{args.host}:{args.port}",
+                args.user,
+                args.password,
+            ]
 
     try:
-        returncode, stdout, stderr = _run_subprocess(command_to_run, use_shell=use_shell)
+        returncode, stdout, stderr = _run_subprocess(command_to_run, input_path=input_path)
 
         if returncode != 0:
             # Handle specific FileNotFoundError after subprocess call
@@ -166,9 +175,7 @@ def run_isql_command(
                     print(f"Make sure '{args.docker_path}' is installed and in your PATH, and the container/isql path is correct.", file=sys.stderr)
                 else:
                     print(f"Make sure Virtuoso client tools (containing '{args.isql_path}') are installed and in your PATH.", file=sys.stderr)
-                    if use_shell:
-                         print(f"Check shell environment if using local script execution.", file=sys.stderr)
-                return False, stdout, f"Executable or shell component not found: {missing_cmd}"
+                return False, stdout, f"Executable not found: {missing_cmd}"
 
             return ignore_errors, stdout, stderr
         return True, stdout, stderr
@@ -176,4 +183,186 @@ def run_isql_command(
         # Catch unexpected errors *around* the subprocess call if any
         print(f"An unexpected error occurred preparing or handling {command_description}: {e}", file=sys.stderr)
         print(f"Command context: {command_to_run}", file=sys.stderr)
-        return False, "", str(e) 
\ No newline at end of file
+        return False, "", str(e) 
+
+
+class IsqlSession:
+    """
+    A long-lived 'isql' process that executes several SQL statements over a
+    single connection, either directly or via 'docker exec -i'.
+
+    Statements are written to the process stdin, each one followed by a
+    SELECT of a unique marker; the output of a statement is everything
+    printed before the marker row. The session runs isql with BANNER=OFF and
+    VERBOSE=OFF, so the output only contains result rows and error messages.
+
+    Usage:
+        with IsqlSession(args) as session:
+            success, stdout, stderr = session.execute("SELECT 1;")
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        """
+        Args:
+            args (argparse.Namespace): Connection details, with the same
+                                       attributes required by run_isql_command.
+        """
+        self.args = args
+        self.process: Union[subprocess.Popen, None] = None
+        self._marker_prefix = f"VU_MARKER_{uuid.uuid4().hex}"
+        self._counter = 0
+
+    def _build_command(self) -> list[str]:
+        if self.args.docker_container:
+            return [
+                self.args.docker_path,
+                'exec',
+                '-i',
+                self.args.docker_container,
+                self.args.docker_isql_path,
+                "localhost:1111",
+                self.args.user,
+                self.args.password,
+                "BANNER=OFF",
+                "VERBOSE=OFF",
+            ]
+        return [
+            self.args.isql_path,
+            f"{self.args.host}:{self.args.port}",
+            self.args.user,
+            self.args.password,
+            "BANNER=OFF",
+            "VERBOSE=OFF",
+        ]
+
+    def open(self) -> None:
+        """Start the isql process."""
+        self.process = subprocess.Popen(
+            self._build_command(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding='utf-8',
+            bufsize=1,
+        )
+
+    def close(self) -> None:
+        """Terminate the isql session, killing the process if it does not exit."""
+        if self.process is None:
+            return
+        try:
+            if self.process.poll() is None:
+                self.process.stdin.write("EXIT;\n")
+                self.process.stdin.flush()
+            self.process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process.stdout.close()
+        self.process = None
+
+    def __enter__(self) -> "IsqlSession":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def execute(self, sql_command: str) -> tuple[bool, str, str]:
+        """
+        Execute one or more SQL statements in the session.
+
+        Args:
+            sql_command (str): The SQL to execute, statements terminated by ';'.
+
+        Returns:
+            tuple: (success_status, stdout, stderr), as in run_isql_command.
+                   stdout holds the result rows, stderr the error messages.
+        """
+        if self.process is None:
+            raise RuntimeError("IsqlSession is not open.")
+
+        sql_command = sql_command.strip()
+        # Without a terminator isql would treat the marker SELECT as part of
+        # the statement and the marker row would never be printed
+        if not sql_command.endswith(";"):
+            sql_command += ";"
+
+        self._counter += 1
+        marker = f"{self._marker_prefix}_{self._counter}"
+        try:
+            self.process.stdin.write(f"{sql_command}\nSELECT '{marker}';\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            return False, "", f"isql session terminated: {e}"
+
+        output_lines = []
+        error_lines = []
+        marker_seen = False
+        for raw_line in self.process.stdout:
+            line = raw_line.strip()
+            while line.startswith(ISQL_PROMPT):
+                line = line[len(ISQL_PROMPT):].lstrip()
+            # An exact match skips both result rows and an echoed (quoted) SELECT
+            if line == marker:
+                marker_seen = True
+                break
+            if not line:
+                continue
+            if error_lines or line.startswith(ISQL_ERROR_PREFIX):
+                error_lines.append(line)
+            else:
+                output_lines.append(line)
+
+        stdout = "\n".join(output_lines)
+        stderr = "\n".join(error_lines)
+        if not marker_seen:
+            # The process exited: any non-error output (e.g. a docker exec or
+            # OCI runtime message) explains why, so report it as well
+            return False, stdout, "\n".join(
+                ["isql session terminated unexpectedly", *output_lines, *error_lines]
+            )
+        return not error_lines, stdout, stderr
+
+    def fetchone(self, sql_command: str) -> Union[tuple[str, ...], None]:
+        """
+        Execute a query and return the first result row.
+
+        With VERBOSE=OFF isql prints one line per row and no column headers,
+        so the columns are split on whitespace; values containing spaces
+        should be fetched through execute() instead.
+
+        Args:
+            sql_command (str): The query to execute.
+
+        Returns:
+            tuple | None: The column values of the first row, or None if the
+                          query failed or returned no rows.
+        """
+        success, stdout, _ = self.execute(sql_command)
+        if not success or not stdout:
+            return None
+        return tuple(stdout.splitlines()[0].split())
+
+    def fetchcolumn(self, sql_command: str) -> Union[list[str], None]:
+        """
+        Execute a single-column query and return its values, one per row.
+
+        Unlike fetchone(), values are not split, so they may contain spaces
+        (e.g. file paths).
+
+        Args:
+            sql_command (str): The query to execute.
+
+        Returns:
+            list | None: The values of the column, or None if the query failed.
+        """
+        success, stdout, _ = self.execute(sql_command)
+        if not success:
+            return None
+        return [line.strip() for line in stdout.splitlines()]
@@ -13,16 +13,24 @@ Configuration parameters can be customized through command-line arguments.
 
 import argparse
 import configparser
+import functools
 import os
 import re
+import shlex
+import shutil
+import socket
 import subprocess
 import sys
+import tempfile
 import time
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import psutil
 
 DEFAULT_WAIT_TIMEOUT = 120
+READY_POLL_INITIAL_INTERVAL = 0.25
+READY_PROGRESS_INTERVAL = 10
+READY_PORT_PROBE_TIMEOUT = 1
 DOCKER_EXEC_PATH = "docker"
 DOCKER_ISQL_PATH_INSIDE_CONTAINER = "isql"
 
@@ -40,6 +48,12 @@ from virtuoso_utilities.isql_helpers import run_isql_command
 MIN_DB_SIZE_FOR_CHECKPOINT_REMAP_GB = 1
 MIN_DB_SIZE_BYTES_FOR_CHECKPOINT_REMAP = MIN_DB_SIZE_FOR_CHECKPOINT_REMAP_GB * 1024**3
 
+# Docker memory format (e.g., "2g", "4096m") and the bytes per unit (no unit means bytes)
+MEMORY_VALUE_PATTERN = re.compile(r'^(\d+)([kmg]?)$')
+MEMORY_UNIT_MULTIPLIERS = {'': 1, 'k': 1024, 'm': 1024**2, 'g': 1024**3}
+# (bit shift, suffix) pairs tried from the largest Docker memory unit down
+DOCKER_MEM_UNIT_SHIFTS = ((30, 'g'), (20, 'm'), (10, 'k'))
+
 # Default directories allowed in Virtuoso
 DEFAULT_DIRS_ALLOWED = {".", "../vad", "/usr/share/proj", "../virtuoso_input"}
 
@@ -58,17 +72,13 @@ def bytes_to_docker_mem_str(num_bytes: int) -> str:
     Convert a number of bytes to a Docker memory string (e.g., "85g", "512m").
     Tries to find the largest unit (G, M, K) without losing precision for integers.
     """
-    if num_bytes % (1024**3) == 0:
-        return f"{num_bytes // (1024**3)}g"
-    elif num_bytes % (1024**2) == 0:
-        return f"{num_bytes // (1024**2)}m"
-    elif num_bytes % 1024 == 0:
-         return f"{num_bytes // 1024}k"
-    else:
-        # Fallback for non-exact multiples (shouldn't happen often with RAM)
-        # Prefer GiB for consistency
-        gb_val = num_bytes / (1024**3)
-        return f"{int(gb_val)}g"
+    # Units are powers of two, so exact multiples are checked with a bit mask
+    for shift, suffix in DOCKER_MEM_UNIT_SHIFTS:
+        if not num_bytes & ((1 << shift) - 1):
+            return f"{num_bytes >> shift}{suffix}"
+    # Fallback for non-exact multiples (shouldn't happen often with RAM)
+    # Prefer GiB for consistency
+    return f"{num_bytes >> 30}g"
 
 
 def parse_memory_value(memory_str: str) -> int:
@@ -83,23 +93,14 @@ def parse_memory_value(memory_str: str) -> int:
     """
     memory_str = memory_str.lower()
     
-    match = re.match(r'^(\d+)([kmg]?)$', memory_str)
+    match = MEMORY_VALUE_PATTERN.match(memory_str)
     if not match:
         # Default to 2GB if parsing fails
         print(f"Warning: Could not parse memory string '{memory_str}'. Defaulting to 2g.", file=sys.stderr)
         return 2 * 1024 * 1024 * 1024
     
     value, unit = match.groups()
-    value = int(value)
-    
-    if unit == 'k':
-        return value * 1024
-    elif unit == 'm':
-        return value * 1024 * 1024
-    elif unit == 'g':
-        return value * 1024 * 1024 * 1024
-    else:  # No unit, assume bytes
-        return value
+    return int(value) * MEMORY_UNIT_MULTIPLIERS[unit]
 
 
 def get_directory_size(directory_path: str) -> int:
@@ -170,9 +171,23 @@ def calculate_max_checkpoint_remap(size_bytes: int) -> int:
     return int(size_bytes / 8192 / 4)
 
 
+@functools.lru_cache(maxsize=1)
+def get_total_host_ram() -> int:
+    """
+    Get the total RAM of the host.
+
+    Total RAM does not change while the process runs, so psutil is queried
+    only once and later calls return the cached value.
+
+    Returns:
+        int: Total host RAM in bytes
+    """
+    return psutil.virtual_memory().total
+
+
 def get_default_memory() -> str:
     try:
-        total_ram = psutil.virtual_memory().total
+        total_ram = get_total_host_ram()
         default_mem = max(int(total_ram * (2 / 3)), 1 * 1024**3)
         return bytes_to_docker_mem_str(default_mem)
     except Exception:
@@ -246,6 +261,14 @@ def is_connection_error(stderr):
     return any(err in stderr_lower for err in CONNECTION_ERROR_PATTERNS)
 
 
+def is_port_open(host, port, timeout=READY_PORT_PROBE_TIMEOUT):
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
 def create_isql_args(dba_password, docker_container=None):
     if docker_container:
         return argparse.Namespace(
@@ -466,9 +489,21 @@ def update_ini_memory_settings(
             print(f"Info: Host data directory '{data_dir_path}' size ({actual_db_size_bytes / (1024**3):.2f} GiB) is below threshold ({MIN_DB_SIZE_FOR_CHECKPOINT_REMAP_GB} GiB). No changes made to MaxCheckpointRemap in virtuoso.ini.")
 
         if made_changes:
-            # Write changes back with UTF-8 encoding
-            with open(ini_path, 'w', encoding='utf-8') as configfile:
-                config.write(configfile)
+            # Write changes to a temporary file next to the original and swap
+            # it in, so an interrupted write never leaves a truncated INI
+            configfile = tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=os.path.dirname(ini_path) or '.',
+                prefix='.virtuoso.ini.', delete=False
+            )
+            try:
+                with configfile:
+                    config.write(configfile)
+                shutil.copymode(ini_path, configfile.name)
+                os.replace(configfile.name, ini_path)
+            except BaseException:
+                # Covers a failed write (e.g. ENOSPC) as well as the swap
+                os.unlink(configfile.name)
+                raise
             print(f"Info: Successfully saved changes to '{ini_path}'.")
         else:
             print(f"Info: No changes needed in '{ini_path}'.")
@@ -504,7 +539,7 @@ def parse_arguments() -> argparse.Namespace:  # pragma: no cover
     default_memory_str = "2g" # Fallback default
     if psutil and not memory_specified:
         try:
-            total_host_ram = psutil.virtual_memory().total
+            total_host_ram = get_total_host_ram()
             # Calculate 2/3 of total RAM in bytes
             default_mem_bytes = int(total_host_ram * (2/3))
             # Ensure at least 1GB is allocated as a minimum default
@@ -639,24 +674,31 @@ def parse_arguments() -> argparse.Namespace:  # pragma: no cover
              "Sets AsyncQueueMaxThreads to cores * 1.5 and ThreadsPerQuery to cores."
     )
 
-    args_temp, _ = parser.parse_known_args()
-
-    optimal_number_of_buffers, optimal_max_dirty_buffers = get_optimal_buffer_values(args_temp.memory)
-    
     parser.add_argument(
         "--max-dirty-buffers", 
         type=int, 
-        default=optimal_max_dirty_buffers,
-        help="Maximum dirty buffers before checkpoint (auto-calculated based on --memory value, requires integer)"
+        default=None,
+        help="Maximum dirty buffers before checkpoint (auto-calculated based on --memory value if not set, requires integer)"
     )
     parser.add_argument(
         "--number-of-buffers", 
         type=int, 
-        default=optimal_number_of_buffers,
-        help="Number of buffers (auto-calculated based on --memory value, requires integer)"
+        default=None,
+        help="Number of buffers (auto-calculated based on --memory value if not set, requires integer)"
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+
+    # Fill in the buffer defaults from the parsed --memory, so the command
+    # line is only parsed once by the full parser
+    if args.number_of_buffers is None or args.max_dirty_buffers is None:
+        optimal_number_of_buffers, optimal_max_dirty_buffers = get_optimal_buffer_values(args.memory)
+        if args.number_of_buffers is None:
+            args.number_of_buffers = optimal_number_of_buffers
+        if args.max_dirty_buffers is None:
+            args.max_dirty_buffers = optimal_max_dirty_buffers
+
+    return args
 
 
 def check_docker_installed() -> bool:
@@ -666,16 +708,9 @@ def check_docker_installed() -> bool:
     Returns:
         bool: True if Docker is installed, False otherwise
     """
-    try:
-        subprocess.run(
-            ["docker", "--version"], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE, 
-            check=True
-        )
-        return True
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return False
+    # A PATH lookup is enough here: a broken binary is reported by the
+    # first real docker call
+    return shutil.which(DOCKER_EXEC_PATH) is not None
 
 
 def check_container_exists(container_name: str) -> bool:
@@ -688,14 +723,52 @@ def check_container_exists(container_name: str) -> bool:
     Returns:
         bool: True if container exists, False otherwise
     """
+    # The anchored filter only matches the exact name, so any ID printed
+    # by --quiet means the container exists
     result = subprocess.run(
-        ["docker", "ps", "-a", "--filter", f"name=^{container_name}$", "--format", "{{.Names}}"],
+        ["docker", "ps", "-aq", "--filter", f"name=^{container_name}$"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    
+    return bool(result.stdout.strip())
+
+
+def get_container_status(container_name: str) -> Union[str, None]:
+    """
+    Get the state of a Docker container with a single 'docker ps' call.
+
+    Only a container with exactly this name is considered: unlike
+    'docker inspect', the name filter never resolves IDs or ID prefixes.
+    This also serves as the Docker availability check: a missing binary
+    raises FileNotFoundError.
+
+    Args:
+        container_name: Name of the container to look up
+
+    Returns:
+        str | None: The container state (e.g. 'running', 'exited'), or None
+                    if no container with that name exists
+
+    Raises:
+        FileNotFoundError: If the docker command is not installed
+        RuntimeError: If Docker fails for another reason (e.g. daemon down)
+    """
+    result = subprocess.run(
+        [DOCKER_EXEC_PATH, "ps", "-a", "--filter", f"name=^{container_name}$",
+         "--format", "{{.Names}}\t{{.State}}"],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True
     )
-    
-    return container_name in result.stdout.strip()
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to query container '{container_name}': {result.stderr.strip()}")
+    # The filter is a regular expression, so compare the name exactly too
+    for line in result.stdout.splitlines():
+        name, _, state = line.partition("\t")
+        if name == container_name:
+            return state.strip()
+    return None
 
 
 def remove_container(container_name: str) -> bool:
@@ -711,8 +784,8 @@ def remove_container(container_name: str) -> bool:
     try:
         subprocess.run(
             ["docker", "rm", "-f", container_name],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True
         )
         return True
@@ -754,56 +827,59 @@ def build_docker_run_command(args: argparse.Namespace) -> Tuple[List[str], List[
             - List of unique container paths intended for DirsAllowed
     """
     host_data_dir_abs = os.path.abspath(args.data_dir)
-    os.makedirs(host_data_dir_abs, exist_ok=True)
-    
-    cmd = [DOCKER_EXEC_PATH, "run"]
-    
-    cmd.extend(["--name", args.name])
-    
-    # Add user mapping to run as the host user
-    try:
-        cmd.extend(["--user", f"{os.getuid()}:{os.getgid()}"])
-    except AttributeError:
-        print("Warning: os.getuid/os.getgid not available on this system (likely Windows). Skipping user mapping.", file=sys.stderr)
-
-    cmd.extend(["-p", f"{args.http_port}:8890"])
-    cmd.extend(["-p", f"{args.isql_port}:1111"])
-    
-    if args.network:
-        cmd.extend(["--network", args.network])
+    if not os.path.isdir(host_data_dir_abs):
+        os.makedirs(host_data_dir_abs, exist_ok=True)
     
     # Ensure container_data_dir is absolute-like for consistency
     container_data_dir_path = DEFAULT_CONTAINER_DATA_DIR
-    cmd.extend(["-v", f"{host_data_dir_abs}:{container_data_dir_path}"])
-
-    # Mount additional volumes
-    if args.extra_volumes:
-        for volume_spec in args.extra_volumes:
-            if ':' in volume_spec:
-                host_path, container_path = volume_spec.split(':', 1)
-                host_path_abs = os.path.abspath(host_path)
-                cmd.extend(["-v", f"{host_path_abs}:{container_path}"])
-
-    # Start with default Virtuoso paths
-    paths_to_allow_in_container = DEFAULT_DIRS_ALLOWED.copy()
-    paths_to_allow_in_container.add(container_data_dir_path)
-    
-    # Add extra mounted volumes to paths_to_allow_in_container
-    if args.extra_volumes:
-        for volume_spec in args.extra_volumes:
-            if ':' in volume_spec:
-                _, container_path = volume_spec.split(':', 1)
-                container_path_abs = container_path if container_path.startswith('/') else '/' + container_path
-                paths_to_allow_in_container.add(container_path_abs)
-                print(f"Info: Adding mounted volume path '{container_path_abs}' to DirsAllowed.")
+
+    # Start with default Virtuoso paths, sorted since set order varies between
+    # runs; a dict deduplicates while keeping the order, so DirsAllowed is the
+    # same on every launch
+    paths_to_allow_in_container = dict.fromkeys(sorted(DEFAULT_DIRS_ALLOWED))
+    paths_to_allow_in_container[container_data_dir_path] = None
+
+    # Parse additional volumes once: they are both mounted and added to DirsAllowed
+    volume_args = []
+    for volume_spec in args.extra_volumes or []:
+        if ':' in volume_spec:
+            host_path, container_path = volume_spec.split(':', 1)
+            volume_args += ["-v", f"{os.path.abspath(host_path)}:{container_path}"]
+            container_path_abs = '/' + container_path.lstrip('/')
+            paths_to_allow_in_container[container_path_abs] = None
+            print(f"Info: Adding mounted volume path '{container_path_abs}' to DirsAllowed.")
 
     memory_bytes = parse_memory_value(args.memory)
     reservation_bytes = int(memory_bytes * VIRTUOSO_MEMORY_PERCENTAGE)
     reservation_str = bytes_to_docker_mem_str(reservation_bytes)
-    cmd.extend(["--memory-reservation", reservation_str])
-    cmd.extend(["--memory", args.memory])
+
+    # Detached containers are kept after exit, foreground ones are removed
+    cmd = [
+        DOCKER_EXEC_PATH, "run",
+        "-d" if args.detach else "--rm",
+        "--name", args.name,
+    ]
+
+    # Add user mapping to run as the host user
+    try:
+        cmd += ["--user", f"{os.getuid()}:{os.getgid()}"]
+    except AttributeError:
+        print("Warning: os.getuid/os.getgid not available on this system (likely Windows). Skipping user mapping.", file=sys.stderr)
+
+    cmd += [
+        "-p", f"{args.http_port}:8890",
+        "-p", f"{args.isql_port}:1111",
+    ]
+    if args.network:
+        cmd += ["--network", args.network]
+    cmd += ["-v", f"{host_data_dir_abs}:{container_data_dir_path}"]
+    cmd += volume_args
+    cmd += [
+        "--memory-reservation", reservation_str,
+        "--memory", args.memory,
+    ]
     if args.cpu_limit > 0:
-        cmd.extend(["--cpus", str(args.cpu_limit)])
+        cmd += ["--cpus", str(args.cpu_limit)]
     
     env_vars = {
         "DBA_PASSWORD": args.dba_password,
@@ -821,21 +897,12 @@ def build_docker_run_command(args: argparse.Namespace) -> Tuple[List[str], List[
     )
     env_vars.update(virt_env_vars)
 
-    for key, value in env_vars.items():
-        cmd.extend(["-e", f"{key}={value}"])
-    
-    if args.detach:
-        cmd.append("-d")
-    
-    # Ensure --rm is added if not running detached
-    if not args.detach:
-        cmd.insert(2, "--rm") # Insert after "docker run"
+    cmd += [part for key, value in env_vars.items() for part in ("-e", f"{key}={value}")]
     
     # Append image name
-    docker_image = get_docker_image(args.virtuoso_version, args.virtuoso_sha)
-    cmd.append(docker_image)
+    cmd.append(get_docker_image(args.virtuoso_version, args.virtuoso_sha))
     
-    return cmd, paths_to_allow_in_container
+    return cmd, list(paths_to_allow_in_container)
 
 
 def wait_for_virtuoso_ready(
@@ -846,25 +913,37 @@ def wait_for_virtuoso_ready(
 ) -> bool:
     print(f"Waiting for Virtuoso to be ready (timeout: {timeout}s)...")
     start_time = time.time()
+    last_report = start_time
     isql_args = create_isql_args(dba_password, docker_container)
+    # Start polling quickly and back off towards poll_interval, so a server
+    # that comes up fast is detected without waiting a full interval
+    delay = min(READY_POLL_INITIAL_INTERVAL, poll_interval)
 
     while time.time() - start_time < timeout:
         try:
-            success, _, stderr = run_isql_command(isql_args, sql_command="status();")
-            if success:
-                print("Virtuoso is ready.")
-                return True
+            # Without Docker a refused connection means the server is not
+            # listening yet, so isql is not started. A container is always
+            # checked through docker exec: docker-proxy accepts connections on
+            # the published port before Virtuoso listens.
+            if not docker_container and not is_port_open(isql_args.host, isql_args.port):
+                stderr = "Connection refused"
+            else:
+                success, _, stderr = run_isql_command(isql_args, sql_command="status();")
+                if success:
+                    print("Virtuoso is ready.")
+                    return True
             if is_connection_error(stderr):
-                elapsed = int(time.time() - start_time)
-                if elapsed % 10 == 0:
-                    print(f"  Waiting for Virtuoso... ({elapsed}s elapsed)")
+                now = time.time()
+                if now - last_report >= READY_PROGRESS_INTERVAL:
+                    print(f"  Waiting for Virtuoso... ({int(now - start_time)}s elapsed)")
+                    last_report = now
             else:
                 print(f"ISQL check failed: {stderr}", file=sys.stderr)
                 return False
-            time.sleep(poll_interval)
         except Exception as e:
             print(f"Warning: Error in readiness check: {e}", file=sys.stderr)
-            time.sleep(poll_interval + 2)
+        time.sleep(delay)
+        delay = min(delay * 2, poll_interval)
 
     print(f"Timeout ({timeout}s) waiting for Virtuoso.", file=sys.stderr)
     return False
@@ -872,12 +951,12 @@ def wait_for_virtuoso_ready(
 
 def run_docker_command(cmd: List[str], capture_output=False, check=True, suppress_error=False):
     """Helper to run Docker commands and handle errors."""
-    print(f"Executing: {' '.join(cmd)}")
+    print(f"Executing: {shlex.join(cmd)}")
     try:
         result = subprocess.run(
             cmd,
-            stdout=subprocess.PIPE if capture_output else sys.stdout,
-            stderr=subprocess.PIPE if capture_output else sys.stderr,
+            stdout=subprocess.PIPE if capture_output else None,
+            stderr=subprocess.PIPE if capture_output else None,
             text=True,
             check=check
         )
@@ -965,22 +1044,19 @@ def launch_virtuoso(  # pragma: no cover
     if not check_docker_installed():
         raise RuntimeError("Docker command not found. Please install Docker.")
 
+    container_status = get_container_status(name)
+
     if memory is None:
-        if psutil:
-            try:
-                total_host_ram = psutil.virtual_memory().total
-                default_mem_bytes = max(int(total_host_ram * (2/3)), 1 * 1024**3)
-                memory = bytes_to_docker_mem_str(default_mem_bytes)
-            except Exception:
-                memory = "2g"
-        else:
-            memory = "2g"
+        memory = get_default_memory()
 
     number_of_buffers, max_dirty_buffers = get_optimal_buffer_values(memory)
 
+    # Resolved once and reused for the docker command and the INI path
+    host_data_dir_abs = os.path.abspath(data_dir)
+
     args = argparse.Namespace(
         name=name,
-        data_dir=data_dir,
+        data_dir=host_data_dir_abs,
         http_port=http_port,
         isql_port=isql_port,
         memory=memory,
@@ -1000,7 +1076,6 @@ def launch_virtuoso(  # pragma: no cover
         parallel_threads=parallel_threads,
     )
 
-    host_data_dir_abs = os.path.abspath(data_dir)
     ini_file_path = os.path.join(host_data_dir_abs, "virtuoso.ini")
 
     docker_cmd, unique_paths_to_allow = build_docker_run_command(args)
@@ -1027,12 +1102,8 @@ def launch_virtuoso(  # pragma: no cover
         resources_cleanup_interval=1,
     )
 
-    if check_container_exists(name):
-        result = subprocess.run(
-            [DOCKER_EXEC_PATH, "ps", "--filter", f"name=^{name}$", "--format", "{{.Status}}"],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        is_running = "Up" in result.stdout
+    if container_status is not None:
+        is_running = container_status == "running"
 
         if force_remove:
             print(f"Container '{name}' already exists. Forcing removal...")
@@ -1063,9 +1134,10 @@ def launch_virtuoso(  # pragma: no cover
         print(f"Virtuoso launched successfully on http://localhost:{http_port}/sparql")
 
     except subprocess.CalledProcessError as e:
+        # Only remove a container with exactly this name: 'docker rm' would
+        # otherwise fall back to an ID-prefix match on an unrelated container
         if detach and check_container_exists(name):
-            run_docker_command([DOCKER_EXEC_PATH, "stop", name], suppress_error=True, check=False)
-            run_docker_command([DOCKER_EXEC_PATH, "rm", name], suppress_error=True, check=False)
+            remove_container(name)
         raise RuntimeError(f"Virtuoso launch failed: {e}")
     except FileNotFoundError:
         raise RuntimeError("Docker command not found.")
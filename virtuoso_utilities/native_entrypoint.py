@@ -120,13 +120,14 @@ def configure_virtuoso(config):
         if config["max_dirty_buffers"] is None:
             config["max_dirty_buffers"] = max_dirty
 
-    dirs = DEFAULT_DIRS_ALLOWED.copy()
-    dirs.add(data_dir)
+    dirs = dict.fromkeys(sorted(DEFAULT_DIRS_ALLOWED))
+    dirs[data_dir] = None
     if config["extra_dirs_allowed"]:
-        extra = set(
-            d.strip() for d in config["extra_dirs_allowed"].split(",") if d.strip()
+        dirs.update(
+            dict.fromkeys(
+                d.strip() for d in config["extra_dirs_allowed"].split(",") if d.strip()
+            )
         )
-        dirs.update(extra)
 
     threading = calculate_threading_config(config["parallel_threads"])
     max_query_mem_value = calculate_max_query_mem(